@@ -1,6 +1,7 @@
 """Data preparation module for Iris dataset."""
 import pandas as pd
 import numpy as np
+from scipy import sparse
 from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
@@ -36,7 +37,17 @@ def split_data(df, test_size=0.25, random_state=42):
 
 
 def standardize_features(X_train, X_test):
-    """Standardize features using StandardScaler fitted on train set."""
+    """Standardize features using StandardScaler fitted on train set.
+
+    Sparse input is scaled without centering (``with_mean=False``) so the
+    zeros are preserved, and CSR matrices are returned.
+    """
+    if sparse.issparse(X_train):
+        scaler = StandardScaler(with_mean=False)
+        X_train_scaled = scaler.fit_transform(X_train.tocsr())
+        X_test_scaled = scaler.transform(X_test.tocsr())
+        return X_train_scaled.tocsr(), X_test_scaled.tocsr(), scaler
+
     scaler = StandardScaler()
     X_train_scaled = scaler.fit_transform(X_train)
     X_test_scaled = scaler.transform(X_test)
@@ -66,7 +77,10 @@ def prepare_stage1_labels(y, singleton_class='setosa'):
 def prepare_stage2_data(X, y, singleton_class='setosa'):
     """Filter data to only merged class for Stage 2 training."""
     mask = y != singleton_class
-    X_merged = X[mask]
+    if sparse.issparse(X):
+        X_merged = X.tocsr()[mask.to_numpy()]
+    else:
+        X_merged = X[mask]
     y_merged = y[mask]
     return X_merged, y_merged
 
@@ -1,8 +1,27 @@
 """Two-stage SVM cascade model."""
 import numpy as np
+from scipy import sparse
 from sklearn.svm import SVC
 
 
+def _hyperplane(svm):
+    """Return dense weight vector and bias of a fitted linear SVC.
+
+    SVC stores ``coef_`` as a sparse matrix when fitted on sparse input.
+    """
+    coef = svm.coef_
+    if sparse.issparse(coef):
+        coef = coef.toarray()
+    return np.asarray(coef[0]).ravel(), svm.intercept_[0]
+
+
+def _predict_linear(svm, X):
+    """Predict labels of a fitted binary linear SVC via ``X @ w + b``."""
+    w, b = _hyperplane(svm)
+    scores = np.asarray(X @ w).ravel() + b
+    return svm.classes_[(scores > 0).astype(int)]
+
+
 class TwoStageSVM:
     """Two-stage cascade SVM classifier."""
 
@@ -35,15 +54,13 @@ class TwoStageSVM:
 
     def get_stage1_params(self):
         """Get Stage 1 hyperplane parameters."""
-        w = self.stage1_svm.coef_[0]
-        b = self.stage1_svm.intercept_[0]
+        w, b = _hyperplane(self.stage1_svm)
         margin = 2.0 / np.linalg.norm(w)
         return w, b, margin
 
     def get_stage2_params(self):
         """Get Stage 2 hyperplane parameters."""
-        w = self.stage2_svm.coef_[0]
-        b = self.stage2_svm.intercept_[0]
+        w, b = _hyperplane(self.stage2_svm)
         margin = 2.0 / np.linalg.norm(w)
         return w, b, margin
 
@@ -53,44 +70,52 @@ class TwoStageSVM:
         Args:
             w_scaled: Weight vector in standardized space
             b_scaled: Bias in standardized space
-            scaler: StandardScaler object
+            scaler: StandardScaler object (``with_mean=False`` for sparse)
 
         Returns:
             w_original, b_original
         """
         w_original = w_scaled / scaler.scale_
-        b_original = b_scaled - np.dot(w_scaled, scaler.mean_ / scaler.scale_)
+        if scaler.with_mean:
+            b_original = b_scaled - np.dot(w_scaled, scaler.mean_ / scaler.scale_)
+        else:
+            b_original = b_scaled
         return w_original, b_original
 
     def predict_cascade(self, X_test):
         """Predict using cascade logic.
 
         Args:
-            X_test: Test features (scaled)
+            X_test: Test features (scaled), DataFrame or scipy.sparse matrix
 
         Returns:
             predictions: DataFrame with stage1_pred, stage2_pred, final_pred
         """
         import pandas as pd
 
-        stage1_pred = self.stage1_svm.predict(X_test)
+        if sparse.issparse(X_test):
+            X_test = X_test.tocsr()
+            X_values = X_test
+            index = None
+        else:
+            X_values = np.asarray(X_test)
+            index = X_test.index
+
+        stage1_pred = _predict_linear(self.stage1_svm, X_values)
+        merged = stage1_pred != 'Singleton'
 
-        stage2_pred = []
-        final_pred = []
+        stage2_pred = np.full(len(stage1_pred), '', dtype=object)
+        if merged.any():
+            stage2_pred[merged] = _predict_linear(
+                self.stage2_svm, X_values[merged]
+            )
 
-        for i, s1_pred in enumerate(stage1_pred):
-            if s1_pred == 'Singleton':
-                stage2_pred.append('')
-                final_pred.append(self.singleton_class)
-            else:
-                s2_pred = self.stage2_svm.predict(X_test.iloc[[i]])[0]
-                stage2_pred.append(s2_pred)
-                final_pred.append(s2_pred)
+        final_pred = np.where(merged, stage2_pred, self.singleton_class)
 
         predictions = pd.DataFrame({
             'stage1_pred': stage1_pred,
             'stage2_pred': stage2_pred,
             'final_pred': final_pred
-        }, index=X_test.index)
+        }, index=index)
 
         return predictions
@@ -1,7 +1,8 @@
 """Visualization module for creating plots."""
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.decomposition import PCA
+from scipy import sparse
+from sklearn.decomposition import PCA, TruncatedSVD
 import io
 import base64
 
@@ -35,6 +36,9 @@ def create_confusion_matrix_plot(cm, labels):
 def create_pca_plot(X_train_scaled, X_test_scaled, y_test, predictions):
     """Create PCA 2D scatter plot and return as base64 string.
 
+    Sparse features are projected with TruncatedSVD instead of PCA so they
+    are never densified.
+
     Args:
         X_train_scaled: Scaled training features
         X_test_scaled: Scaled test features
@@ -44,12 +48,15 @@ def create_pca_plot(X_train_scaled, X_test_scaled, y_test, predictions):
     Returns:
         Base64 encoded image string
     """
-    pca = PCA(n_components=2, random_state=42)
+    if sparse.issparse(X_train_scaled):
+        pca = TruncatedSVD(n_components=2, random_state=42)
+    else:
+        pca = PCA(n_components=2, random_state=42)
     pca.fit(X_train_scaled)
 
     X_test_pca = pca.transform(X_test_scaled)
 
-    correct = y_test == predictions['final_pred']
+    correct = y_test.values == predictions['final_pred'].values
 
     species_colors = {
         'setosa': '#1f77b4',
@@ -60,7 +67,7 @@ def create_pca_plot(X_train_scaled, X_test_scaled, y_test, predictions):
     fig, ax = plt.subplots(figsize=(10, 8))
 
     for species in sorted(y_test.unique()):
-        mask = y_test == species
+        mask = (y_test == species).values
 
         correct_mask = mask & correct
         incorrect_mask = mask & ~correct